@@ -17,6 +17,7 @@
 
 import asyncio
 import enum
+import functools
 import logging
 import typing
 from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
@@ -88,7 +89,8 @@ class BusMessage(libsystemd.sd_bus_message):
         """
         reply = BusMessage()
         self._new_method_return(byref(reply))
-        reply.append(signature, *args)
+        if signature or args:
+            reply.append(signature, *args)
         return reply
 
     def new_method_error(self, error: Union[BusError, OSError]) -> 'BusMessage':
@@ -125,8 +127,12 @@ class BusMessage(libsystemd.sd_bus_message):
         """
         types = bustypes.from_signature(signature)
         assert len(types) == len(args), f'call args {args} have different length than signature {signature}'
-        for type_, arg in zip(types, args):
-            type_.writer(self, arg)
+        if len(types) == 1:
+            # overwhelmingly the common case
+            types[0].writer(self, args[0])
+        else:
+            for type_, arg in zip(types, args):
+                type_.writer(self, arg)
 
     def get_body(self) -> Tuple[object, ...]:
         """Gets the body of a message.
@@ -197,7 +203,7 @@ class BusMessage(libsystemd.sd_bus_message):
 
         :returns: True
         """
-        if asyncio.coroutines.iscoroutine(return_value):
+        if asyncio.iscoroutine(return_value):
             task = asyncio.create_task(return_value)
             task.add_done_callback(lambda task: self._coroutine_task_complete(out_type, task))
             return True
@@ -316,7 +322,8 @@ class Bus(libsystemd.sd_bus):
     ) -> BusMessage:
         message = BusMessage()
         self._message_new_method_call(byref(message), destination, path, interface, member)
-        message.append(types, *args)
+        if types or args:
+            message.append(types, *args)
         return message
 
     def message_new_signal(
@@ -324,7 +331,8 @@ class Bus(libsystemd.sd_bus):
     ) -> BusMessage:
         message = BusMessage()
         self._message_new_signal(byref(message), path, interface, member)
-        message.append(types, *args)
+        if types or args:
+            message.append(types, *args)
         return message
 
     def call(self, message: BusMessage, timeout: Optional[int] = None) -> BusMessage:
@@ -513,6 +521,7 @@ class Interface:
     # Class variables
     _dbus_interfaces: Dict[str, Dict[str, Dict[str, Any]]]
     _dbus_members: Optional[Tuple[str, Dict[str, Dict[str, Any]]]]
+    _dbus_methods: 'Dict[Tuple[str, str], Interface.Method]'
 
     # Instance variables: stored in Python form
     _dbus_property_values: Optional[Dict[str, Any]] = None
@@ -538,6 +547,14 @@ class Interface:
                                     for ancestor in cls.mro()
                                     if '_dbus_members' in ancestor.__dict__)
 
+        # Flattened method routing table, so message dispatch is a single
+        # dict lookup instead of a walk over the interfaces.
+        cls._dbus_methods = {
+            (interface_name, name): method
+            for interface_name, categories in cls._dbus_interfaces.items()
+            for name, method in categories['methods'].items()
+        }
+
     @classmethod
     def _find_interface(cls, interface: str) -> Dict[str, Dict[str, '_Member']]:
         try:
@@ -806,16 +823,25 @@ class org_freedesktop_DBus_Peer(Interface):
 
     @Interface.Method('s')
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_machine_id() -> str:
+        # Immutable for the process lifetime: no need to re-read it per call.
         with open('/etc/machine-id', encoding='ascii') as file:
             return file.read().strip()
 
 
 class org_freedesktop_DBus_Introspectable(Interface):
+    _dbus_introspect_xml: str
+
     @Interface.Method('s')
     @classmethod
     def introspect(cls) -> str:
-        return introspection.to_xml(cls._dbus_interfaces)
+        # The set of interfaces is fixed at class creation time, so the XML
+        # never changes: generate it once per class.  Check our own __dict__
+        # to make sure we don't pick up a value cached by a parent class.
+        if '_dbus_introspect_xml' not in cls.__dict__:
+            cls._dbus_introspect_xml = introspection.to_xml(cls._dbus_interfaces)
+        return cls._dbus_introspect_xml
 
 
 class org_freedesktop_DBus_Properties(Interface):
@@ -850,12 +876,11 @@ class Object(org_freedesktop_DBus_Introspectable,
     implement your D-Bus interface.
     """
     def message_received(self, message: BusMessage) -> bool:
-        interface = message.get_interface()
-        name = message.get_member()
+        method = self._dbus_methods.get((message.get_interface(), message.get_member()))
+        if method is None:
+            return False
 
         try:
-            method = self._find_member(interface, 'methods', name)
-            assert isinstance(method, Interface.Method)
             return method._invoke(self, message)
         except Object.Method.Unhandled:
             return False
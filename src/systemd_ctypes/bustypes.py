@@ -256,6 +256,15 @@ class ContainerType(Type):
                          **kwargs)
 
 
+# Fixed-width element types eligible for the bulk array API.  'b' is a fixed
+# size on the wire, but sd_bus_message_append_array() doesn't accept it.
+_fixed_array_ctypes: Dict[str, type] = {
+    'y': ctypes.c_uint8, 'n': ctypes.c_int16, 'q': ctypes.c_uint16,
+    'i': ctypes.c_int32, 'u': ctypes.c_uint32, 'x': ctypes.c_int64,
+    't': ctypes.c_uint64, 'd': ctypes.c_double,
+}
+
+
 class ArrayType(ContainerType):
     _typestring_template = 'a_'
     __slots__ = ()
@@ -266,7 +275,20 @@ class ArrayType(ContainerType):
                          item_reader=item_type.reader,
                          list_append=list.append)
 
-    def get_reader(self, enter_container, exit_container, list_append, item_reader):
+    def get_reader(self, enter_container, exit_container, list_append, item_reader,
+                   read_array, char_p, char_p_ref, size_t, size_t_ref):
+        item_typestring = self.item_types[0].typestring
+        ctype = _fixed_array_ctypes.get(item_typestring)
+        if ctype is not None:
+            type_constant = ctypes.c_char(ord(item_typestring))
+            itemsize = ctypes.sizeof(ctype)
+
+            def fixed_array_reader(message: libsystemd.sd_bus_message) -> object:
+                if read_array(message, type_constant, char_p_ref, size_t_ref) <= 0:
+                    raise StopIteration
+                return ctypes.cast(char_p, ctypes.POINTER(ctype))[:size_t.value // itemsize]
+            return fixed_array_reader
+
         def array_reader(message: libsystemd.sd_bus_message) -> object:
             if enter_container(message, 0, None) <= 0:
                 raise StopIteration
@@ -280,12 +302,37 @@ class ArrayType(ContainerType):
                 exit_container(message)
         return array_reader
 
-    def get_writer(self, a, type_contents, open_container, close_container, item_writer):
+    def get_writer(self, a, type_contents, open_container, close_container, item_writer,
+                   append_array, size_t, size_t_setter):
         def array_writer(message: libsystemd.sd_bus_message, value: object) -> None:
             open_container(message, a, type_contents)
             for item in value:  # type: ignore[attr-defined] # can throw TypeError
                 item_writer(message, item)
             close_container(message)
+
+        item_typestring = self.item_types[0].typestring
+        ctype = _fixed_array_ctypes.get(item_typestring)
+        if ctype is not None:
+            type_constant = ctypes.c_char(ord(item_typestring))
+            itemsize = ctypes.sizeof(ctype)
+
+            def fixed_array_writer(message: libsystemd.sd_bus_message, value: object) -> None:
+                try:
+                    array = (ctype * len(value))(*value)  # type: ignore[arg-type,misc] # can throw TypeError
+                    # ctypes silently truncates out-of-range integers: make
+                    # sure what we'd send is what we were given.
+                    usable = array[:] == list(value)  # type: ignore[call-overload]
+                except TypeError:
+                    usable = False
+                if not usable:
+                    # Non-sequences and unrepresentable items take the
+                    # per-item path, which raises the usual errors.
+                    array_writer(message, value)
+                    return
+                size_t_setter(size_t, len(array) * itemsize)
+                append_array(message, type_constant, array, size_t)
+            return fixed_array_writer
+
         return array_writer
 
 
@@ -450,7 +497,7 @@ _factory_map: Dict[object, Callable[..., Type]] = {
 }
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=None)
 def from_annotation(annotation: Union[str, type, BusType]) -> Type:
     # Simple Python types
     if isinstance(annotation, str):
@@ -483,7 +530,7 @@ _base_typestring_map: Dict[str, Type] = {
 }
 
 
-@functools.lru_cache()
+@functools.lru_cache(maxsize=None)
 def from_signature(signature: str) -> Tuple[Type, ...]:
     stack = list(reversed(signature))
 
@@ -16,6 +16,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import ctypes
+import functools
 import inspect
 import logging
 import os
@@ -80,7 +81,10 @@ class utf8(ctypes.c_char_p):
         return self.value.decode()
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def from_param(cls, value: str) -> 'utf8':
+        # The same strings (destinations, paths, interfaces, members) get
+        # passed over and over again: cache the encoded form.
         return cls(value.encode())
 
 
@@ -91,6 +95,7 @@ class utf8_or_null(ctypes.c_char_p):
         return self.value.decode() if self.value is not None else None
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def from_param(cls, value: Optional[str]) -> 'utf8_or_null':
         return cls(value.encode() if value is not None else None)
 
@@ -182,6 +182,24 @@ def test_thats_too_much_man(message: BusMessage, typestring: str, value: object)
         message.append_arg(typestring, value)
 
 
+@pytest.mark.parametrize('typestring', ['an', 'aq', 'ai', 'au', 'ax', 'at', 'ad'])
+def test_fixed_array(message: BusMessage, typestring: str) -> None:
+    message.append_arg(typestring, [])
+    message.append_arg(typestring, [0, 1, 2])
+    message.append_arg(typestring, iter([3, 4]))  # not a sequence: takes the per-item path
+    message.seal(0, 0)
+    assert message.get_body() == ([], [0, 1, 2], [3, 4])
+
+
+@pytest.mark.parametrize(('typestring', 'value'), [
+    ('ai', [2**31]), ('ai', [-2**31 - 1]), ('ai', [one_half]), ('ai', ['x']),
+    ('at', [-1]), ('ad', [one_third]),
+])
+def test_fixed_array_bad_values(message: BusMessage, typestring: str, value: object) -> None:
+    with pytest.raises(TypeError):
+        message.append_arg(typestring, value)
+
+
 @pytest.mark.parametrize('typestring', [
     *'bynqiuxtdsog',
     'ay', 'ai', 'as',